@@ -85,21 +85,36 @@ recursive_dates AS (
     SELECT date(id_date, '+1 day')
     FROM recursive_dates, date_range
     WHERE id_date < date(max_date)
+),
+-- Extract each date part once per row; every column below is derived from
+-- these integers instead of re-running strftime for each one.
+date_parts AS (
+    SELECT
+        id_date,
+        CAST(strftime('%Y', id_date) AS INTEGER) AS y,
+        CAST(strftime('%m', id_date) AS INTEGER) AS m,
+        CAST(strftime('%d', id_date) AS INTEGER) AS d,
+        CAST(strftime('%W', id_date) AS INTEGER) AS wk,
+        CAST(strftime('%j', id_date) AS INTEGER) AS doy,
+        CAST(strftime('%w', id_date) AS INTEGER) AS dow
+    FROM recursive_dates
 )
 SELECT
     ROW_NUMBER() OVER (ORDER BY id_date)                            AS date_int,
     id_date,
-    strftime('%d/%m/%Y', id_date)                                   AS date_local_format,
-    CAST(strftime('%Y%m%d', id_date) AS INTEGER)                    AS date_integer,
-    CAST(strftime('%Y', id_date) AS INTEGER)                        AS year,
-    CAST(strftime('%Y', id_date) AS INTEGER) % 100                  AS year_short,
+    -- %x / %y / %B / %b / %A / %a are not supported by SQLite's strftime;
+    -- they return NULL.  Use CASE expressions and arithmetic instead.
+    printf('%02d/%02d/%04d', d, m, y)                               AS date_local_format,
+    y * 10000 + m * 100 + d                                         AS date_integer,
+    y                                                               AS year,
+    y % 100                                                         AS year_short,
     -- NOTE: quarter/quarter_name deliberately use month number to
     -- preserve parity with the original DimDate view behaviour.
-    CAST(strftime('%m', id_date) AS INTEGER)                        AS quarter,
-    'Q' || CAST(strftime('%m', id_date) AS INTEGER)                 AS quarter_name,
-    CAST(strftime('%m', id_date) AS INTEGER)                        AS month_number,
-    strftime('%m', id_date)                                         AS month_number_padded,
-    CASE CAST(strftime('%m', id_date) AS INTEGER)
+    m                                                               AS quarter,
+    'Q' || m                                                        AS quarter_name,
+    m                                                               AS month_number,
+    printf('%02d', m)                                               AS month_number_padded,
+    CASE m
         WHEN 1  THEN 'January'   WHEN 2  THEN 'February'
         WHEN 3  THEN 'March'     WHEN 4  THEN 'April'
         WHEN 5  THEN 'May'       WHEN 6  THEN 'June'
@@ -107,53 +122,41 @@ SELECT
         WHEN 9  THEN 'September' WHEN 10 THEN 'October'
         WHEN 11 THEN 'November'  WHEN 12 THEN 'December'
     END                                                             AS month_name,
-    CASE CAST(strftime('%m', id_date) AS INTEGER)
+    CASE m
         WHEN 1  THEN 'Jan' WHEN 2  THEN 'Feb' WHEN 3  THEN 'Mar'
         WHEN 4  THEN 'Apr' WHEN 5  THEN 'May' WHEN 6  THEN 'Jun'
         WHEN 7  THEN 'Jul' WHEN 8  THEN 'Aug' WHEN 9  THEN 'Sep'
         WHEN 10 THEN 'Oct' WHEN 11 THEN 'Nov' WHEN 12 THEN 'Dec'
     END                                                             AS month_abbrv,
-    CAST(strftime('%Y%m', id_date) AS INTEGER)                      AS period,
-    CAST(strftime('%W', id_date) AS INTEGER)                        AS week,
-    CAST(strftime('%Y%W', id_date) AS INTEGER)                      AS year_week,
-    CAST(strftime('%d', id_date) AS INTEGER)                        AS day_of_month,
-    CAST(strftime('%j', id_date) AS INTEGER)                        AS day_of_year,
-    CAST(strftime('%w', id_date) AS INTEGER) + 1                    AS day_of_week,
-    CASE CAST(strftime('%w', id_date) AS INTEGER)
+    y * 100 + m                                                     AS period,
+    wk                                                              AS week,
+    y * 100 + wk                                                    AS year_week,
+    d                                                               AS day_of_month,
+    doy                                                             AS day_of_year,
+    dow + 1                                                         AS day_of_week,
+    CASE dow
         WHEN 0 THEN 'Sunday'    WHEN 1 THEN 'Monday'
         WHEN 2 THEN 'Tuesday'   WHEN 3 THEN 'Wednesday'
         WHEN 4 THEN 'Thursday'  WHEN 5 THEN 'Friday'
         WHEN 6 THEN 'Saturday'
     END                                                             AS weekday,
-    CASE CAST(strftime('%w', id_date) AS INTEGER)
+    CASE dow
         WHEN 0 THEN 'Sun' WHEN 1 THEN 'Mon' WHEN 2 THEN 'Tue'
         WHEN 3 THEN 'Wed' WHEN 4 THEN 'Thu' WHEN 5 THEN 'Fri'
         WHEN 6 THEN 'Sat'
     END                                                             AS weekday_abbrv,
-    CASE CAST(strftime('%w', id_date) AS INTEGER)
+    CASE dow
         WHEN 0 THEN 'S' WHEN 1 THEN 'M' WHEN 2 THEN 'T'
         WHEN 3 THEN 'W' WHEN 4 THEN 'T' WHEN 5 THEN 'F'
         WHEN 6 THEN 'S'
     END                                                             AS weekday_initial,
-    CASE
-        WHEN CAST(strftime('%d', id_date) AS INTEGER) =
-             CAST(strftime('%d', date(id_date, 'start of month', '+1 month', '-1 day')) AS INTEGER)
-        THEN 1 ELSE 0
-    END                                                             AS is_last_day_of_month,
-    CASE
-        WHEN CAST(strftime('%d', id_date) AS INTEGER) =
-             CAST(strftime('%d', date(id_date, 'start of month', '+1 month', '-1 day')) AS INTEGER)
-        AND CAST(strftime('%m', id_date) AS INTEGER) % 3 = 0
-        THEN 1 ELSE 0
-    END                                                             AS is_last_day_of_quarter,
-    CASE
-        WHEN CAST(strftime('%d', id_date) AS INTEGER) =
-             CAST(strftime('%d', date(id_date, 'start of month', '+1 month', '-1 day')) AS INTEGER)
-        AND CAST(strftime('%m', id_date) AS INTEGER) = 12
-        THEN 1 ELSE 0
-    END                                                             AS is_last_day_of_year,
-    CASE WHEN strftime('%w', id_date) NOT IN ('0', '6') THEN 1 ELSE 0 END AS is_weekday
-FROM recursive_dates;
+    -- Comparisons already evaluate to 1/0 in SQLite, so no CASE is needed.
+    id_date = date(id_date, 'start of month', '+1 month', '-1 day') AS is_last_day_of_month,
+    id_date = date(id_date, 'start of month', '+1 month', '-1 day')
+        AND m % 3 = 0                                               AS is_last_day_of_quarter,
+    m = 12 AND d = 31                                               AS is_last_day_of_year,
+    dow NOT IN (0, 6)                                               AS is_weekday
+FROM date_parts;
 
 CREATE INDEX idx_dt_id_date ON DimDate (id_date);
 
@@ -179,6 +182,9 @@ SELECT
     ROW_NUMBER() OVER (ORDER BY id_account) AS account_int,
     id_account, company, account_type, account_number, sortcode, account_holder, currency
 FROM (
+    -- SQLite takes the bare columns of an aggregate query from the row
+    -- that supplied MAX(), i.e. each account's latest statement, in one
+    -- grouped pass with no window sort.
     SELECT
         sh.ID_ACCOUNT           AS id_account,
         sh.STD_COMPANY          AS company,
@@ -187,14 +193,11 @@ FROM (
         sh.STD_SORTCODE         AS sortcode,
         sh.STD_ACCOUNT_HOLDER   AS account_holder,
         sh.STD_CURRENCY         AS currency,
-        ROW_NUMBER() OVER (
-            PARTITION BY sh.ID_ACCOUNT
-            ORDER BY sh.STD_STATEMENT_DATE DESC
-        ) AS rn
+        MAX(sh.STD_STATEMENT_DATE)
     FROM statement_heads sh
     WHERE sh.ID_ACCOUNT IS NOT NULL
-)
-WHERE rn = 1;
+    GROUP BY sh.ID_ACCOUNT
+);
 
 
 -- ---------------------------------------------------------------------------
@@ -293,11 +296,11 @@ SELECT
     ROW_NUMBER() OVER (ORDER BY sl.ID_TRANSACTION) AS transaction_int,
     sl.ID_TRANSACTION,
     ds.statement_int,
-    da.account_int,
+    ds.account_int,
     dd.date_int,
     sl.STD_TRANSACTION_DATE,
-    sh.ID_ACCOUNT,
-    sh.ID_STATEMENT,
+    ds.id_account,
+    ds.id_statement,
     sl.STD_TRANSACTION_NUMBER,
     sl.STD_CD,
     sl.STD_TRANSACTION_TYPE,
@@ -308,9 +311,9 @@ SELECT
     CAST(sl.STD_TRANSACTION_PAYMENTS_OUT AS REAL),
     CAST(sl.STD_TRANSACTION_PAYMENTS_IN  AS REAL) - CAST(sl.STD_TRANSACTION_PAYMENTS_OUT AS REAL)
 FROM statement_lines sl
-INNER JOIN statement_heads sh ON sl.ID_STATEMENT  = sh.ID_STATEMENT
-INNER JOIN DimStatement    ds ON sh.ID_STATEMENT  = ds.id_statement
-INNER JOIN DimAccount      da ON sh.ID_ACCOUNT    = da.id_account
+-- DimStatement already carries the account keys, so neither
+-- statement_heads nor DimAccount needs to be joined again.
+INNER JOIN DimStatement    ds ON sl.ID_STATEMENT  = ds.id_statement
 INNER JOIN DimDate         dd ON sl.STD_TRANSACTION_DATE = dd.id_date;
 
 CREATE INDEX idx_ft_account_date ON FactTransaction (account_int, date_int);
@@ -424,7 +427,7 @@ SELECT
               OVER (PARTITION BY g.account_int, g.fwd_group)
     END                                                              AS closing_balance,
     g.movement,
-    CASE WHEN g.pre_date = 1 OR g.post_date = 1 THEN 1 ELSE 0 END  AS outside_date
+    (g.pre_date = 1 OR g.post_date = 1)                             AS outside_date
 FROM _fb_grid g;
 
 CREATE INDEX idx_fb_account_date ON FactBalance (account_int, date_int);
@@ -21,7 +21,7 @@ from pathlib import Path
 from bank_statement_parser.data.create_project_db_views import create_views
 
 # DDL for the exchange_rates reference table.  Uses a composite primary key
-# (id_date, currency) so it cannot be created via the generic create_table()
+# (id_date, currency) so it cannot be built by the generic _build_create_sql()
 # helper (which only supports single-column PKs).
 _DDL_EXCHANGE_RATES = """
 CREATE TABLE exchange_rates (
@@ -144,7 +144,8 @@ PRIMARY_KEYS = {
 }
 
 
-def create_table(conn, table_name, schema: dict, with_fk: bool = False):
+def _build_create_sql(table_name: str, schema: dict, with_fk: bool = False) -> str:
+    """Return the ``CREATE TABLE`` statement for *table_name* without executing it."""
     col_defs = []
     for col_name, col_type in schema.items():
         if table_name in PRIMARY_KEYS and PRIMARY_KEYS[table_name] == col_name:
@@ -155,11 +156,7 @@ def create_table(conn, table_name, schema: dict, with_fk: bool = False):
     if with_fk and table_name in FOREIGN_KEYS:
         col_defs.extend(FOREIGN_KEYS[table_name])
 
-    create_sql = f"CREATE TABLE {table_name} (\n    " + ",\n    ".join(col_defs) + "\n);"
-    print(f"Creating table: {table_name}")
-    print(create_sql)
-    print()
-    conn.execute(create_sql)
+    return f"CREATE TABLE {table_name} (\n    " + ",\n    ".join(col_defs) + "\n);"
 
 
 def main(db_path: Path, with_fk: bool = False) -> None:
@@ -185,15 +182,21 @@ def main(db_path: Path, with_fk: bool = False) -> None:
 
     table_order = ["batch_heads", "batch_lines", "statement_heads", "checks_and_balances", "statement_lines"]
 
+    sql_parts = []
     for table_name in table_order:
-        create_table(conn, table_name, SCHEMAS[table_name], with_fk)
+        create_sql = _build_create_sql(table_name, SCHEMAS[table_name], with_fk)
+        print(f"Creating table: {table_name}")
+        print(create_sql)
+        print()
+        sql_parts.append(create_sql)
 
     # exchange_rates has a composite PK — create it separately.
     print("Creating table: exchange_rates")
     print(_DDL_EXCHANGE_RATES)
-    conn.execute(_DDL_EXCHANGE_RATES)
+    sql_parts.append(_DDL_EXCHANGE_RATES)
 
-    conn.commit()
+    # One parser pass for the whole schema instead of an execute() per table.
+    conn.executescript("BEGIN;\n" + "\n".join(sql_parts) + "\nCOMMIT;")
     conn.close()
     print(f"Database created: {db_path}")
 
@@ -53,19 +53,17 @@ def create_views(db_path: Path):
                 statement_date,
                 opening_balance,
                 closing_balance,
-                LAG(closing_balance) OVER (
-                    PARTITION BY account_type, account_number
-                    ORDER BY statement_date
-                ) AS prev_closing_balance,
+                LAG(closing_balance) OVER prev AS prev_closing_balance,
                 CASE
-                    WHEN account_type || account_number =
-                         LAG(account_type || account_number) OVER (
-                             PARTITION BY account_type, account_number
-                             ORDER BY statement_date
-                         )
+                    WHEN account_type = LAG(account_type) OVER prev
+                     AND account_number = LAG(account_number) OVER prev
                     THEN 0 ELSE 1
                 END AS account_change
             FROM ordered_statements
+            WINDOW prev AS (
+                PARTITION BY account_type, account_number
+                ORDER BY statement_date
+            )
         )
         SELECT
             account_type,
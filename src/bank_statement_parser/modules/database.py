@@ -28,6 +28,7 @@ from pathlib import Path
 from time import time
 
 import polars as pl
+import polars.selectors as cs
 
 from bank_statement_parser.data.build_datamart import _ensure_mart_structure, build_datamart
 from bank_statement_parser.modules.data import PdfResult, Success
@@ -133,19 +134,17 @@ _VIEW_MIGRATIONS: list[tuple[str, str]] = [
                 statement_date,
                 opening_balance,
                 closing_balance,
-                LAG(closing_balance) OVER (
-                    PARTITION BY account_type, account_number
-                    ORDER BY statement_date
-                ) AS prev_closing_balance,
+                LAG(closing_balance) OVER prev AS prev_closing_balance,
                 CASE
-                    WHEN account_type || account_number =
-                         LAG(account_type || account_number) OVER (
-                             PARTITION BY account_type, account_number
-                             ORDER BY statement_date
-                         )
+                    WHEN account_type = LAG(account_type) OVER prev
+                     AND account_number = LAG(account_number) OVER prev
                     THEN 0 ELSE 1
                 END AS account_change
             FROM ordered_statements
+            WINDOW prev AS (
+                PARTITION BY account_type, account_number
+                ORDER BY statement_date
+            )
         )
         SELECT
             account_type,
@@ -384,6 +383,17 @@ def _migrate_db(conn: sqlite3.Connection) -> None:
     conn.commit()
 
 
+def _read_parquets(files: list[Path]) -> pl.DataFrame:
+    """Read and concatenate *files*, returning an empty frame when there are none.
+
+    The files are scanned as one multi-file source, so Polars reads them in
+    parallel instead of decoding each one eagerly and concatenating.
+    """
+    if not files:
+        return pl.DataFrame()
+    return pl.scan_parquet(files).collect()
+
+
 def update_db(
     processed_pdfs: list[BaseException | PdfResult],
     batch_id: str,
@@ -402,8 +412,9 @@ def update_db(
     """
     Insert processed batch results into the SQLite database.
 
-    Iterates through processed PDFs, reads each temporary parquet file,
-    and inserts its rows into the corresponding database table. Also writes
+    Iterates through processed PDFs, reads the temporary parquet files for
+    each table as one frame and inserts its rows into the corresponding
+    database table. Also writes
     batch header metadata. Should be called after all PDFs have been
     processed and before deleting temporary files.
 
@@ -451,10 +462,8 @@ def update_db(
         if df.is_empty():
             return
         columns = [col for col in df.columns if col != "index"]
-        df_to_insert = df.select(columns)
-        for col in df_to_insert.columns:
-            if df_to_insert[col].dtype == pl.Decimal:
-                df_to_insert = df_to_insert.with_columns(pl.col(col).cast(pl.Float64))
+        # SQLite stores money as REAL, so convert every Decimal column in one pass.
+        df_to_insert = df.select(columns).with_columns(cs.decimal().cast(pl.Float64))
         placeholders = ", ".join(["?"] * len(columns))
         cols_str = ", ".join([f'"{col}"' for col in columns])
         sql = f"INSERT OR REPLACE INTO {table_name} ({cols_str}) VALUES ({placeholders})"
@@ -465,7 +474,7 @@ def update_db(
 
     # Write batch_lines first (before any statement data).
     # This ensures batch records are always persisted, even if statement data fails.
-    batch_lines_dfs: list[pl.DataFrame] = []
+    batch_lines_files: list[Path] = []
     for pdf in processed_pdfs:
         if isinstance(pdf, BaseException):
             conn.close()
@@ -473,35 +482,37 @@ def update_db(
         elif isinstance(pdf, PdfResult):
             # batch_lines is always present on PdfResult
             if pdf.batch_lines and pdf.batch_lines.exists():
-                df = pl.read_parquet(pdf.batch_lines)
-                batch_lines_dfs.append(df)
-                pdf.batch_lines.unlink()
+                batch_lines_files.append(pdf.batch_lines)
 
-    # Insert all batch_lines and commit as separate transaction
-    for df in batch_lines_dfs:
-        _insert_df(df, "batch_lines")
+    # Each table's temp files are read as one frame and inserted with a single
+    # executemany, rather than one round trip per statement.
+    _insert_df(_read_parquets(batch_lines_files), "batch_lines")
     conn.commit()  # Commit batch_lines first
 
     # Write statement and CAB data in main transaction.
     # If any statement data fails, batch_lines are already committed.
+    cab_files: list[Path] = []
+    heads_files: list[Path] = []
+    lines_files: list[Path] = []
     for pdf in processed_pdfs:
         if isinstance(pdf, PdfResult):
             # checks_and_balances is present for SUCCESS and REVIEW
             if pdf.checks_and_balances and pdf.checks_and_balances.exists():
-                df = pl.read_parquet(pdf.checks_and_balances)
-                _insert_df(df, "checks_and_balances")
-                pdf.checks_and_balances.unlink()
+                cab_files.append(pdf.checks_and_balances)
             # statement_heads and statement_lines are only inserted for SUCCESS
             if pdf.result == "SUCCESS" and isinstance(pdf.payload, Success):
                 pq_files = pdf.payload.parquet_files
                 if pq_files.statement_heads and pq_files.statement_heads.exists():
-                    df = pl.read_parquet(pq_files.statement_heads)
-                    _insert_df(df, "statement_heads")
-                    pq_files.statement_heads.unlink()
+                    heads_files.append(pq_files.statement_heads)
                 if pq_files.statement_lines and pq_files.statement_lines.exists():
-                    df = pl.read_parquet(pq_files.statement_lines)
-                    _insert_df(df, "statement_lines")
-                    pq_files.statement_lines.unlink()
+                    lines_files.append(pq_files.statement_lines)
+
+    _insert_df(_read_parquets(cab_files), "checks_and_balances")
+    _insert_df(_read_parquets(heads_files), "statement_heads")
+    _insert_df(_read_parquets(lines_files), "statement_lines")
+
+    for file in batch_lines_files + cab_files + heads_files + lines_files:
+        file.unlink()
 
     db_secs = time() - update_start
 
@@ -58,6 +58,21 @@ class _ConfigEntry(TypedDict):
     config: dict[str, Any]
 
 
+# Parsed and linked config sections shared by every ImportConfigManager in the
+# process, keyed by (config directory, section) and validated against the
+# TOML files' signature so that edits on disk are picked up on the next load.
+_CONFIG_CACHE: dict[tuple[Path, str], tuple[tuple[tuple[str, int, int], ...], dict[str, _ConfigEntry]]] = {}
+
+
+def _config_signature(config_dir: Path) -> tuple[tuple[str, int, int], ...]:
+    """Return the path, modification time and size of every TOML file under *config_dir*."""
+    signature: list[tuple[str, int, int]] = []
+    for path in sorted(config_dir.rglob("*.toml")):
+        stat = path.stat()
+        signature.append((str(path), stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
 REQUIRED_CONFIG_FILES: list[str] = [
     "companies.toml",
     "account_types.toml",
@@ -132,6 +147,8 @@ class ImportConfigManager:
     Attributes:
         _project_path: Optional project root directory path.
         _config_dict: Internal storage for loaded configuration.
+        _standard_fields: Standard fields loaded on their own when the full
+            configuration has not been needed.
         _accounts_df: Lazy-loaded DataFrame of accounts.
         _statement_types_df: Lazy-loaded DataFrame of statement types.
         _companies_df: Lazy-loaded DataFrame of companies.
@@ -142,7 +159,7 @@ class ImportConfigManager:
         >>> accounts = config.get_accounts_for_company("my_company")
     """
 
-    __slots__ = ("_accounts_df", "_companies_df", "_config_dict", "_project_path", "_statement_types_df")
+    __slots__ = ("_accounts_df", "_companies_df", "_config_dict", "_project_path", "_standard_fields", "_statement_types_df")
 
     def __init__(self, project_path: Path | None = None) -> None:
         """
@@ -158,6 +175,7 @@ class ImportConfigManager:
         """
         self._project_path: Path | None = project_path
         self._config_dict: dict[str, _ConfigEntry] | None = None
+        self._standard_fields: dict[str, StandardFields] | None = None
         self._accounts_df: pl.DataFrame | None = None
         self._statement_types_df: pl.DataFrame | None = None
         self._companies_df: pl.DataFrame | None = None
@@ -193,8 +211,29 @@ class ImportConfigManager:
 
     @property
     def standard_fields(self) -> dict[str, StandardFields]:
-        """Return dictionary of all standard fields keyed by field name."""
-        return self.config_dict["standard_fields"]["config"]
+        """
+        Return dictionary of all standard fields keyed by field name.
+
+        Standard fields do not reference any other section, so when the full
+        configuration has not been loaded only ``standard_fields.toml`` files
+        are parsed rather than building every account and statement type.
+        """
+        if self._config_dict is not None:
+            return self._config_dict["standard_fields"]["config"]
+        if self._standard_fields is None:
+            if self._project_path is not None:
+                self._require_config_dir()
+            config_dir = self.config_dir
+            signature = _config_signature(config_dir)
+            cached = _CONFIG_CACHE.get((config_dir, "all")) or _CONFIG_CACHE.get((config_dir, "standard_fields"))
+            if cached is not None and cached[0] == signature:
+                config_dict = cached[1]
+            else:
+                config_dict = {"standard_fields": {"dataclass": StandardFields, "config": {}}}
+                self._load_section(config_dict, "standard_fields")
+                _CONFIG_CACHE[(config_dir, "standard_fields")] = (signature, config_dict)
+            self._standard_fields = config_dict["standard_fields"]["config"]
+        return self._standard_fields
 
     @property
     def accounts_df(self) -> pl.DataFrame:
@@ -252,10 +291,23 @@ class ImportConfigManager:
 
         Converts raw TOML data to dataclasses and links cross-section
         references between statement tables and account objects.
+
+        The linked result is cached for the lifetime of the process and
+        reused by later managers for the same config directory until any of
+        its TOML files is added, removed or modified.  Callers that need to
+        change a config object should work on a copy (as
+        ``Statement.get_config`` does).
         """
         if self._project_path is not None:
             self._require_config_dir()
 
+        config_dir = self.config_dir
+        signature = _config_signature(config_dir)
+        cached = _CONFIG_CACHE.get((config_dir, "all"))
+        if cached is not None and cached[0] == signature:
+            self._config_dict = cached[1]
+            return
+
         config_dict: dict[str, _ConfigEntry] = {
             "companies": {"dataclass": Company, "config": {}},
             "account_types": {"dataclass": AccountType, "config": {}},
@@ -266,23 +318,38 @@ class ImportConfigManager:
         }
 
         for key in config_dict:
-            file_name = f"{key}.toml"
-            # Load root-level file first (e.g. account_types.toml, standard_fields.toml)
-            self._merge_toml_file(config_dict, key, self.config_dir.joinpath(file_name))
-            # Load matching files from each immediate company subdirectory
-            for subdir in sorted(self.config_dir.iterdir()):
-                if subdir.is_dir():
-                    self._merge_toml_file(config_dict, key, subdir.joinpath(file_name))
-
-        for v in config_dict.values():
-            for k in v["config"]:
-                v["config"][k] = from_dict(data_class=v["dataclass"], data=v["config"][k])
+            self._load_section(config_dict, key)
 
         self._link_statement_tables(config_dict)
         self._link_account_references(config_dict)
 
+        _CONFIG_CACHE[(config_dir, "all")] = (signature, config_dict)
         self._config_dict = config_dict
 
+    def _load_section(self, config_dict: dict[str, _ConfigEntry], key: str) -> None:
+        """
+        Load every TOML file for one config section and convert its entries to dataclasses.
+
+        The root-level file is merged first, followed by the matching file in
+        each immediate company subdirectory.  Cross-section links are not
+        resolved here.
+
+        Args:
+            config_dict: The configuration dictionary to populate.
+            key: The config section key (e.g., 'companies', 'accounts').
+        """
+        file_name = f"{key}.toml"
+        # Load root-level file first (e.g. account_types.toml, standard_fields.toml)
+        self._merge_toml_file(config_dict, key, self.config_dir.joinpath(file_name))
+        # Load matching files from each immediate company subdirectory
+        for subdir in sorted(self.config_dir.iterdir()):
+            if subdir.is_dir():
+                self._merge_toml_file(config_dict, key, subdir.joinpath(file_name))
+
+        section = config_dict[key]
+        for k in section["config"]:
+            section["config"][k] = from_dict(data_class=section["dataclass"], data=section["config"][k])
+
     def _merge_toml_file(self, config_dict: dict[str, _ConfigEntry], key: str, file_path: Path) -> None:
         """
         Load a single TOML file and merge its entries into the config dictionary.
@@ -33,6 +33,8 @@ Functions:
 
 from __future__ import annotations
 
+import io
+from collections.abc import Iterable
 from datetime import datetime
 from pathlib import Path
 from time import time
@@ -42,71 +44,250 @@ import polars as pl
 from bank_statement_parser.modules.data import PdfResult, Success
 from bank_statement_parser.modules.paths import ProjectPaths
 
+# Serialised empty parquet files, keyed by schema, so ``truncate`` only
+# encodes each table's blank file once per process.
+_EMPTY_PARQUET: dict[tuple, bytes] = {}
+
+# Empty, typed frames describing each parquet table.  Built once at import
+# and shared by every instance; anything that appends to a schema must work
+# on a clone.
+_SCHEMA_CAB = pl.DataFrame(
+    orient="row",
+    schema={
+        "ID_CAB": pl.Utf8,
+        "ID_BATCHLINE": pl.Utf8,
+        "ID_BATCH": pl.Utf8,
+        "HAS_TRANSACTIONS": pl.Boolean,
+        "STD_OPENING_BALANCE_HEADS": pl.Decimal(16, 4),
+        "STD_PAYMENTS_IN_HEADS": pl.Decimal(16, 4),
+        "STD_PAYMENTS_OUT_HEADS": pl.Decimal(16, 4),
+        "STD_MOVEMENT_HEADS": pl.Decimal(16, 4),
+        "STD_CLOSING_BALANCE_HEADS": pl.Decimal(16, 4),
+        "STD_OPENING_BALANCE_LINES": pl.Decimal(16, 4),
+        "STD_PAYMENTS_IN_LINES": pl.Decimal(16, 4),
+        "STD_PAYMENTS_OUT_LINES": pl.Decimal(16, 4),
+        "STD_MOVEMENT_LINES": pl.Decimal(16, 4),
+        "STD_CLOSING_BALANCE_LINES": pl.Decimal(16, 4),
+        "CHECK_PAYMENTS_IN": pl.Boolean,
+        "CHECK_PAYMENTS_OUT": pl.Boolean,
+        "CHECK_MOVEMENT": pl.Boolean,
+        "CHECK_CLOSING": pl.Boolean,
+        "TRANSACTION_LINE_COUNT": pl.UInt32,
+        "TRANSACTION_LINES_WITH_NULL_DATE": pl.UInt32,
+        "TRANSACTION_LINES_WITH_NULL_DESC": pl.UInt32,
+    },
+)
+
+_SCHEMA_STATEMENT_HEADS = pl.DataFrame(
+    orient="row",
+    schema={
+        "ID_STATEMENT": pl.Utf8,
+        "ID_BATCHLINE": pl.Utf8,
+        "ID_ACCOUNT": pl.Utf8,
+        "STD_COMPANY": pl.Utf8,
+        "STD_STATEMENT_TYPE": pl.Utf8,
+        "STD_ACCOUNT": pl.Utf8,
+        "STD_CURRENCY": pl.Utf8,
+        "STD_SORTCODE": pl.Utf8,
+        "STD_ACCOUNT_NUMBER": pl.Utf8,
+        "STD_ACCOUNT_HOLDER": pl.Utf8,
+        "STD_STATEMENT_DATE": pl.Date,
+        "STD_OPENING_BALANCE": pl.Decimal(16, 4),
+        "STD_PAYMENTS_IN": pl.Decimal(16, 4),
+        "STD_PAYMENTS_OUT": pl.Decimal(16, 4),
+        "STD_CLOSING_BALANCE": pl.Decimal(16, 4),
+    },
+)
+
+_SCHEMA_STATEMENT_LINES = pl.DataFrame(
+    orient="row",
+    schema={
+        "ID_TRANSACTION": pl.Utf8,
+        "ID_STATEMENT": pl.Utf8,
+        "STD_PAGE_NUMBER": pl.Int32,
+        "STD_TRANSACTION_DATE": pl.Date,
+        "STD_TRANSACTION_NUMBER": pl.UInt32,
+        "STD_CD": pl.Utf8,
+        "STD_TRANSACTION_TYPE": pl.Utf8,
+        "STD_TRANSACTION_TYPE_CD": pl.Utf8,
+        "STD_TRANSACTION_DESC": pl.Utf8,
+        "STD_OPENING_BALANCE": pl.Decimal(16, 4),
+        "STD_TRANSACTION_PAYMENTS_IN": pl.Decimal(16, 4),
+        "STD_TRANSACTION_PAYMENTS_OUT": pl.Decimal(16, 4),
+        "STD_CLOSING_BALANCE": pl.Decimal(16, 4),
+    },
+)
+
+_SCHEMA_BATCH_HEADS = pl.DataFrame(
+    orient="row",
+    schema={
+        "ID_BATCH": pl.Utf8,
+        "ID_SESSION": pl.Utf8,
+        "ID_USER": pl.Utf8,
+        "STD_PATH": pl.Utf8,
+        "STD_COMPANY": pl.Utf8,
+        "STD_ACCOUNT": pl.Utf8,
+        "STD_PDF_COUNT": pl.Int64,
+        "STD_ERROR_COUNT": pl.Int64,
+        "STD_REVIEW_COUNT": pl.Int64,
+        "STD_DURATION_SECS": pl.Float64,
+        "STD_UPDATETIME": pl.Datetime,
+    },
+)
+
+_SCHEMA_BATCH_LINES = pl.DataFrame(
+    orient="row",
+    schema={
+        "ID_BATCH": pl.Utf8,
+        "ID_BATCHLINE": pl.Utf8,
+        "ID_STATEMENT": pl.Utf8,
+        "STD_BATCH_LINE": pl.Int64,
+        "STD_FILENAME": pl.Utf8,
+        "STD_ACCOUNT": pl.Utf8,
+        "STD_DURATION_SECS": pl.Float64,
+        "STD_UPDATETIME": pl.Datetime,
+        "STD_SUCCESS": pl.Boolean,
+        "STD_ERROR_MESSAGE": pl.Utf8,
+        "ERROR_CAB": pl.Boolean,
+        "ERROR_CONFIG": pl.Boolean,
+        "ERROR_DATA": pl.Boolean,
+    },
+)
+
 
 class Parquet:
-    __slots__ = ("db_records", "file", "key", "records", "schema")
+    __slots__ = ("_db_records", "file", "key", "records", "schema")
 
-    def __init__(self, file: Path, schema: pl.DataFrame, records: pl.DataFrame | None, key: str | None) -> None:
+    def __init__(self, file: Path, schema: pl.DataFrame, records: pl.DataFrame | pl.LazyFrame | None, key: str | None) -> None:
         self.file = file
         self.schema = schema
         self.records = records
         self.key = key
-        self.db_records: pl.DataFrame = schema
-        try:
-            existing = pl.read_parquet(file)
-            # Auto-delete stale parquet files whose column layout no longer matches
-            # the current schema (e.g. ID_BATCH → ID_BATCHLINE migration).
-            if set(existing.drop("index").columns) != set(schema.columns):
-                file.unlink()
-            else:
-                self.db_records = existing.drop("index")
-        except FileNotFoundError:
-            pass
+        # Existing rows are attached by _load_existing() on the first create/update/delete,
+        # so that truncate() never touches the file it is about to overwrite.
+        self._db_records: pl.LazyFrame | None = None
+
+    @property
+    def db_records(self) -> pl.LazyFrame:
+        """Return the cached rows of ``self.file``; empty until an operation has loaded or written them."""
+        if self._db_records is None:
+            return self.schema.lazy()
+        return self._db_records
+
+    @db_records.setter
+    def db_records(self, value: pl.LazyFrame) -> None:
+        self._db_records = value
+
+    def _load_existing(self) -> pl.LazyFrame:
+        """Attach the rows already held in ``self.file`` to ``db_records`` and return them.
+
+        Runs once, at the start of the first create/update/delete.  A file whose column
+        layout no longer matches the schema is deleted and treated as empty.
+
+        Returns:
+            A LazyFrame over the existing rows, or the empty schema when there are none.
+        """
+        if self._db_records is None:
+            self._db_records = self.schema.lazy()
+            # Temp files never exist yet when a wrapper is built to create them, so
+            # check with a stat call before handing the path to Polars.
+            if self.file.exists():
+                # Only the footer is read here; rows are pulled in by whichever
+                # operation consumes db_records.
+                existing = pl.scan_parquet(self.file)
+                # Files written by earlier versions carry a redundant ``index`` column.
+                columns = set(existing.collect_schema().names()) - {"index"}
+                # Auto-delete stale parquet files whose column layout no longer matches
+                # the current schema (e.g. ID_BATCH → ID_BATCHLINE migration).
+                if columns != set(self.schema.columns):
+                    self.file.unlink()
+                else:
+                    self._db_records = existing.drop("index", strict=False)
+        return self._db_records
 
     def cleanup(self):
-        self.db_records = pl.DataFrame()
+        self.db_records = pl.LazyFrame()
         self.file = Path()
 
     def create(self):  # only to be used if we know the record doesn't exist
         if self.records is not None and self.file:
-            self.db_records = self.db_records.extend(self.records)
-            self.db_records.with_row_index().write_parquet(self.file)
+            merged = pl.concat([self._load_existing(), self.records.lazy()])
+            if self.file.exists():
+                merged = merged.collect()
+                self._write(merged)
+                self.db_records = merged.lazy()
+            else:
+                # Nothing to merge with (the usual case for per-statement temp
+                # files), so stream the records straight to disk.
+                merged.sink_parquet(self.file)
+                self.db_records = pl.scan_parquet(self.file)
             return True
         return False
 
     def update(self):  # this will add a new record or update a current record with the same id
         if self.records is not None and self.key is not None and self.file:
-            self.db_records = self.db_records.remove(pl.col(self.key).is_in(self.records[self.key].implode()))
-            self.db_records = self.db_records.extend(self.records)
-            self.db_records.with_row_index().write_parquet(self.file)
+            # Within the incoming records the last occurrence of a key wins, as
+            # it would if they had been applied one update at a time.
+            records = self.records.lazy().unique(subset=self.key, keep="last", maintain_order=True)
+            # Drop the superseded rows and append the new ones in a single lazy
+            # query so only the merged frame is materialised.
+            merged = pl.concat(
+                [
+                    self._load_existing().join(records.select(self.key), on=self.key, how="anti", maintain_order="left"),
+                    records,
+                ]
+            ).collect()
+            self._write(merged)
+            self.db_records = merged.lazy()
 
     def delete(self):  # deletes the records from the database with the matched keys
         if self.records is not None and self.key is not None and self.file:  # delete the specified records
-            self.db_records = self.db_records.remove(pl.col(self.key).is_in(self.records[self.key].implode()))
-            self.db_records.with_row_index().write_parquet(self.file)
+            remaining = (
+                self._load_existing().join(self.records.lazy().select(self.key), on=self.key, how="anti", maintain_order="left").collect()
+            )
+            self._write(remaining)
+            self.db_records = remaining.lazy()
             return True
         else:
             return False
 
     def truncate(self):  # clears all records and replaces with a blank schema
         if self.file:
-            self.schema.with_row_index().write_parquet(self.file)
+            key = tuple(self.schema.schema.items())
+            if key not in _EMPTY_PARQUET:
+                buffer = io.BytesIO()
+                self.schema.write_parquet(buffer)
+                _EMPTY_PARQUET[key] = buffer.getvalue()
+            self.file.write_bytes(_EMPTY_PARQUET[key])
+
+    def _write(self, frame: pl.DataFrame) -> None:
+        """Write *frame* to ``self.file`` with the default ``write_parquet`` options.
+
+        Frames assembled by concatenation can hold several chunks; these are rechunked first so the
+        writer gets contiguous columns.
+        """
+        if frame.n_chunks() > 1:
+            frame = frame.rechunk()
+        frame.write_parquet(self.file)
 
     def delete_file(self):
-        if self.file and self.file.is_file():
-            self.file.unlink()
+        # cleanup() resets file to Path(), which has no name and must not be unlinked.
+        if self.file.name:
+            self.file.unlink(missing_ok=True)
 
 
-def _load_source(source: Path) -> pl.DataFrame:
-    """Read a parquet file and drop the ``index`` column.
+def _load_source(source: Path | list[Path]) -> pl.DataFrame:
+    """Read one or more parquet files, dropping the ``index`` column written by older versions.
 
     Args:
-        source: Path to the parquet file to read.
+        source: Path, or list of paths, of the parquet file(s) to read.  A list
+            is read into a single DataFrame in the order given.
 
     Returns:
-        DataFrame with the ``index`` column removed.
+        DataFrame without an ``index`` column.
     """
-    return pl.read_parquet(source).drop("index")
+    sources = source if isinstance(source, list) else [source]
+    return pl.concat([pl.scan_parquet(path).drop("index", strict=False) for path in sources]).collect()
 
 
 class ChecksAndBalances(Parquet):
@@ -114,10 +295,11 @@ class ChecksAndBalances(Parquet):
 
     Args:
         file: Destination parquet file path.
-        source: Optional separate source path to read initial records from.
-            When provided, records are loaded from *source* rather than built
-            from the data arguments.  When omitted, *file* is used as the
-            source when reading existing data (via the base class).
+        source: Optional separate source path (or list of paths) to read
+            initial records from.  When provided, records are loaded from
+            *source* rather than built from the data arguments.  When
+            omitted, *file* is used as the source when reading existing data
+            (via the base class).
         id_batchline: Batch-line identifier (required when building records
             from raw data).
         id_batch: Batch identifier (required when building records from raw
@@ -132,37 +314,12 @@ class ChecksAndBalances(Parquet):
     def __init__(
         self,
         file: Path,
-        source: Path | None = None,
+        source: Path | list[Path] | None = None,
         id_batchline: str | None = None,
         id_batch: str | None = None,
         checks_and_balances: pl.DataFrame | None = None,
     ) -> None:
-        self.schema = pl.DataFrame(
-            orient="row",
-            schema={
-                "ID_CAB": pl.Utf8,
-                "ID_BATCHLINE": pl.Utf8,
-                "ID_BATCH": pl.Utf8,
-                "HAS_TRANSACTIONS": pl.Boolean,
-                "STD_OPENING_BALANCE_HEADS": pl.Decimal(16, 4),
-                "STD_PAYMENTS_IN_HEADS": pl.Decimal(16, 4),
-                "STD_PAYMENTS_OUT_HEADS": pl.Decimal(16, 4),
-                "STD_MOVEMENT_HEADS": pl.Decimal(16, 4),
-                "STD_CLOSING_BALANCE_HEADS": pl.Decimal(16, 4),
-                "STD_OPENING_BALANCE_LINES": pl.Decimal(16, 4),
-                "STD_PAYMENTS_IN_LINES": pl.Decimal(16, 4),
-                "STD_PAYMENTS_OUT_LINES": pl.Decimal(16, 4),
-                "STD_MOVEMENT_LINES": pl.Decimal(16, 4),
-                "STD_CLOSING_BALANCE_LINES": pl.Decimal(16, 4),
-                "CHECK_PAYMENTS_IN": pl.Boolean,
-                "CHECK_PAYMENTS_OUT": pl.Boolean,
-                "CHECK_MOVEMENT": pl.Boolean,
-                "CHECK_CLOSING": pl.Boolean,
-                "TRANSACTION_LINE_COUNT": pl.UInt32,
-                "TRANSACTION_LINES_WITH_NULL_DATE": pl.UInt32,
-                "TRANSACTION_LINES_WITH_NULL_DESC": pl.UInt32,
-            },
-        )
+        self.schema = _SCHEMA_CAB
         self.key = "ID_CAB"
         self.records: pl.DataFrame | None = None
 
@@ -179,7 +336,8 @@ class StatementHeads(Parquet):
 
     Args:
         file: Destination parquet file path.
-        source: Optional separate source path to read initial records from.
+        source: Optional separate source path (or list of paths) to read
+            initial records from.
         id_statement: Unique statement identifier.
         id_batchline: Batch-line identifier.
         id_account: Account identifier.
@@ -196,7 +354,7 @@ class StatementHeads(Parquet):
     def __init__(
         self,
         file: Path,
-        source: Path | None = None,
+        source: Path | list[Path] | None = None,
         id_statement: str | None = None,
         id_batchline: str | None = None,
         id_account: str | None = None,
@@ -206,26 +364,7 @@ class StatementHeads(Parquet):
         header_results: pl.LazyFrame | None = None,
         currency: str | None = None,
     ) -> None:
-        self.schema = pl.DataFrame(
-            orient="row",
-            schema={
-                "ID_STATEMENT": pl.Utf8,
-                "ID_BATCHLINE": pl.Utf8,
-                "ID_ACCOUNT": pl.Utf8,
-                "STD_COMPANY": pl.Utf8,
-                "STD_STATEMENT_TYPE": pl.Utf8,
-                "STD_ACCOUNT": pl.Utf8,
-                "STD_CURRENCY": pl.Utf8,
-                "STD_SORTCODE": pl.Utf8,
-                "STD_ACCOUNT_NUMBER": pl.Utf8,
-                "STD_ACCOUNT_HOLDER": pl.Utf8,
-                "STD_STATEMENT_DATE": pl.Date,
-                "STD_OPENING_BALANCE": pl.Decimal(16, 4),
-                "STD_PAYMENTS_IN": pl.Decimal(16, 4),
-                "STD_PAYMENTS_OUT": pl.Decimal(16, 4),
-                "STD_CLOSING_BALANCE": pl.Decimal(16, 4),
-            },
-        )
+        self.schema = _SCHEMA_STATEMENT_HEADS
         self.key = "ID_STATEMENT"
         self.records: pl.DataFrame | None = None
 
@@ -244,7 +383,8 @@ class StatementLines(Parquet):
 
     Args:
         file: Destination parquet file path.
-        source: Optional separate source path to read initial records from.
+        source: Optional separate source path (or list of paths) to read
+            initial records from.
         id_statement: Unique statement identifier.
         lines_results: LazyFrame of extracted transaction lines.
     """
@@ -254,30 +394,13 @@ class StatementLines(Parquet):
     def __init__(
         self,
         file: Path,
-        source: Path | None = None,
+        source: Path | list[Path] | None = None,
         id_statement: str | None = None,
         lines_results: pl.LazyFrame | None = None,
     ) -> None:
-        self.schema = pl.DataFrame(
-            orient="row",
-            schema={
-                "ID_TRANSACTION": pl.Utf8,
-                "ID_STATEMENT": pl.Utf8,
-                "STD_PAGE_NUMBER": pl.Int32,
-                "STD_TRANSACTION_DATE": pl.Date,
-                "STD_TRANSACTION_NUMBER": pl.UInt32,
-                "STD_CD": pl.Utf8,
-                "STD_TRANSACTION_TYPE": pl.Utf8,
-                "STD_TRANSACTION_TYPE_CD": pl.Utf8,
-                "STD_TRANSACTION_DESC": pl.Utf8,
-                "STD_OPENING_BALANCE": pl.Decimal(16, 4),
-                "STD_TRANSACTION_PAYMENTS_IN": pl.Decimal(16, 4),
-                "STD_TRANSACTION_PAYMENTS_OUT": pl.Decimal(16, 4),
-                "STD_CLOSING_BALANCE": pl.Decimal(16, 4),
-            },
-        )
+        self.schema = _SCHEMA_STATEMENT_LINES
         self.key = "ID_TRANSACTION"
-        self.records: pl.DataFrame | None = None
+        self.records: pl.DataFrame | pl.LazyFrame | None = None
 
         if source is not None:
             self.records = _load_source(source)
@@ -322,22 +445,7 @@ class BatchHeads(Parquet):
         duration_secs: float | None = None,
         process_time: datetime | None = None,
     ) -> None:
-        self.schema = pl.DataFrame(
-            orient="row",
-            schema={
-                "ID_BATCH": pl.Utf8,
-                "ID_SESSION": pl.Utf8,
-                "ID_USER": pl.Utf8,
-                "STD_PATH": pl.Utf8,
-                "STD_COMPANY": pl.Utf8,
-                "STD_ACCOUNT": pl.Utf8,
-                "STD_PDF_COUNT": pl.Int64,
-                "STD_ERROR_COUNT": pl.Int64,
-                "STD_REVIEW_COUNT": pl.Int64,
-                "STD_DURATION_SECS": pl.Float64,
-                "STD_UPDATETIME": pl.Datetime,
-            },
-        )
+        self.schema = _SCHEMA_BATCH_HEADS
         self.records: pl.DataFrame | None = None
         if batch_id is not None:
             self.records = build_batch_heads_records(
@@ -363,7 +471,8 @@ class BatchLines(Parquet):
 
     Args:
         file: Destination parquet file path.
-        source: Optional separate source path to read initial records from.
+        source: Optional separate source path (or list of paths) to read
+            initial records from.
         batch_lines: List of dicts, one per PDF, with batch-line metadata.
     """
 
@@ -372,27 +481,10 @@ class BatchLines(Parquet):
     def __init__(
         self,
         file: Path,
-        source: Path | None = None,
+        source: Path | list[Path] | None = None,
         batch_lines: list[dict] | None = None,
     ) -> None:
-        self.schema = pl.DataFrame(
-            orient="row",
-            schema={
-                "ID_BATCH": pl.Utf8,
-                "ID_BATCHLINE": pl.Utf8,
-                "ID_STATEMENT": pl.Utf8,
-                "STD_BATCH_LINE": pl.Int64,
-                "STD_FILENAME": pl.Utf8,
-                "STD_ACCOUNT": pl.Utf8,
-                "STD_DURATION_SECS": pl.Float64,
-                "STD_UPDATETIME": pl.Datetime,
-                "STD_SUCCESS": pl.Boolean,
-                "STD_ERROR_MESSAGE": pl.Utf8,
-                "ERROR_CAB": pl.Boolean,
-                "ERROR_CONFIG": pl.Boolean,
-                "ERROR_DATA": pl.Boolean,
-            },
-        )
+        self.schema = _SCHEMA_BATCH_LINES
         self.key = "ID_BATCHLINE"
         self.records: pl.DataFrame | None = None
 
@@ -409,7 +501,7 @@ def _build_checks_and_balances_data(
     id_batch: str,
     checks_and_balances: pl.DataFrame,
 ) -> pl.DataFrame:
-    """Build the data DataFrame for ChecksAndBalances (without extending the schema).
+    """Build the data DataFrame for ChecksAndBalances (before schema validation).
 
     Args:
         id_batchline: Batch-line identifier.
@@ -463,9 +555,9 @@ def build_checks_and_balances_records(
             :class:`~bank_statement_parser.modules.statements.Statement`.
 
     Returns:
-        A single-row DataFrame matching *schema* ready for ``.extend()``.
+        A single-row DataFrame matching *schema*.
     """
-    return schema.clone().extend(_build_checks_and_balances_data(id_batchline, id_batch, checks_and_balances))
+    return _build_checks_and_balances_data(id_batchline, id_batch, checks_and_balances).cast(schema.schema)
 
 
 def _build_statement_heads_data(
@@ -478,7 +570,7 @@ def _build_statement_heads_data(
     header_results: pl.LazyFrame,
     currency: str | None = None,
 ) -> pl.DataFrame:
-    """Build the data DataFrame for StatementHeads (without extending the schema).
+    """Build the data DataFrame for StatementHeads (before schema validation).
 
     Args:
         id_statement: Unique statement identifier.
@@ -493,30 +585,30 @@ def _build_statement_heads_data(
 
     Returns:
         A single-row DataFrame with the StatementHeads columns.
+
+    Raises:
+        ValueError: If *header_results* does not hold exactly one row.
     """
-    return pl.DataFrame(
-        data={
-            "ID_STATEMENT": id_statement,
-            "ID_BATCHLINE": id_batchline,
-            "ID_ACCOUNT": id_account,
-            "STD_COMPANY": company,
-            "STD_STATEMENT_TYPE": statement_type,
-            "STD_ACCOUNT": account,
-            "STD_CURRENCY": currency,
-        },
-        orient="row",
-    ).hstack(
-        header_results.select(
-            "STD_SORTCODE",
-            "STD_ACCOUNT_NUMBER",
-            "STD_ACCOUNT_HOLDER",
-            "STD_STATEMENT_DATE",
-            "STD_OPENING_BALANCE",
-            "STD_PAYMENTS_IN",
-            "STD_PAYMENTS_OUT",
-            "STD_CLOSING_BALANCE",
-        ).collect()
-    )
+    data = header_results.select(
+        ID_STATEMENT=pl.lit(id_statement),
+        ID_BATCHLINE=pl.lit(id_batchline),
+        ID_ACCOUNT=pl.lit(id_account),
+        STD_COMPANY=pl.lit(company),
+        STD_STATEMENT_TYPE=pl.lit(statement_type),
+        STD_ACCOUNT=pl.lit(account),
+        STD_CURRENCY=pl.lit(currency),
+        STD_SORTCODE=pl.col("STD_SORTCODE"),
+        STD_ACCOUNT_NUMBER=pl.col("STD_ACCOUNT_NUMBER"),
+        STD_ACCOUNT_HOLDER=pl.col("STD_ACCOUNT_HOLDER"),
+        STD_STATEMENT_DATE=pl.col("STD_STATEMENT_DATE"),
+        STD_OPENING_BALANCE=pl.col("STD_OPENING_BALANCE"),
+        STD_PAYMENTS_IN=pl.col("STD_PAYMENTS_IN"),
+        STD_PAYMENTS_OUT=pl.col("STD_PAYMENTS_OUT"),
+        STD_CLOSING_BALANCE=pl.col("STD_CLOSING_BALANCE"),
+    ).collect()
+    if data.height != 1:
+        raise ValueError(f"Expected a single statement header row for {id_statement}, found {data.height}")
+    return data
 
 
 def build_statement_heads_records(
@@ -545,35 +637,35 @@ def build_statement_heads_records(
             on this statement.  Derived from the account's field configuration.
 
     Returns:
-        A single-row DataFrame matching *schema* ready for ``.extend()``.
+        A single-row DataFrame matching *schema*.
     """
-    return schema.clone().extend(
-        _build_statement_heads_data(id_statement, id_batchline, id_account, company, statement_type, account, header_results, currency)
-    )
+    return _build_statement_heads_data(
+        id_statement, id_batchline, id_account, company, statement_type, account, header_results, currency
+    ).cast(schema.schema)
 
 
 def _build_statement_lines_data(
     id_statement: str,
     lines_results: pl.LazyFrame,
-) -> pl.DataFrame:
-    """Build the data DataFrame for StatementLines (without extending the schema).
+) -> pl.LazyFrame:
+    """Build the data LazyFrame for StatementLines (before schema validation).
 
     Args:
         id_statement: Unique statement identifier.
         lines_results: LazyFrame of extracted transaction lines.
 
     Returns:
-        A multi-row DataFrame with the StatementLines columns.
+        A LazyFrame with the StatementLines columns.
     """
-    return lines_results.collect().select(
-        ID_TRANSACTION=pl.lit(id_statement).add(pl.lit(".").add(pl.col("STD_TRANSACTION_NUMBER").cast(str))),
+    return lines_results.select(
+        ID_TRANSACTION=pl.concat_str([pl.lit(f"{id_statement}."), pl.col("STD_TRANSACTION_NUMBER").cast(pl.Utf8)]),
         ID_STATEMENT=pl.lit(id_statement),
         STD_PAGE_NUMBER="STD_PAGE_NUMBER",
         STD_TRANSACTION_DATE="STD_TRANSACTION_DATE",
         STD_TRANSACTION_NUMBER="STD_TRANSACTION_NUMBER",
         STD_CD="STD_CD",
         STD_TRANSACTION_TYPE="STD_TRANSACTION_TYPE",
-        STD_TRANSACTION_TYPE_CD=pl.col("STD_TRANSACTION_TYPE").add("-").add(pl.col("STD_CD")),
+        STD_TRANSACTION_TYPE_CD=pl.concat_str([pl.col("STD_TRANSACTION_TYPE"), pl.col("STD_CD")], separator="-"),
         STD_TRANSACTION_DESC="STD_TRANSACTION_DESC",
         STD_OPENING_BALANCE=pl.col("STD_RUNNING_BALANCE").sub(pl.col("STD_TRANSACTION_MOVEMENT")),
         STD_TRANSACTION_PAYMENTS_IN="STD_TRANSACTION_PAYMENTS_IN",
@@ -586,8 +678,12 @@ def build_statement_lines_records(
     schema: pl.DataFrame,
     id_statement: str,
     lines_results: pl.LazyFrame,
-) -> pl.DataFrame:
-    """Build the records DataFrame for a StatementLines parquet write.
+) -> pl.LazyFrame:
+    """Build the records for a StatementLines parquet write.
+
+    The result is left lazy so the projection is pushed into
+    *lines_results* and the lines are only materialised once, when the
+    parquet file is written.
 
     Args:
         schema: Empty DataFrame with the correct column types.
@@ -595,9 +691,32 @@ def build_statement_lines_records(
         lines_results: LazyFrame of extracted transaction lines.
 
     Returns:
-        A multi-row DataFrame matching *schema* ready for ``.extend()``.
+        A LazyFrame matching *schema*.
     """
-    return schema.clone().extend(_build_statement_lines_data(id_statement, lines_results))
+    return _build_statement_lines_data(id_statement, lines_results).cast(schema.schema)
+
+
+def _require_schema_columns(name: str, columns: Iterable[str], schema: pl.DataFrame) -> None:
+    """Raise if *columns* are not exactly the columns of *schema*.
+
+    Building a DataFrame with ``schema=`` silently drops unknown keys and fills
+    missing ones with null, so a misspelled field would otherwise be written as
+    NULL without any error.
+
+    Args:
+        name: Record type named in the error message (e.g. ``"BatchLines"``).
+        columns: Column names supplied for one record.
+        schema: Empty DataFrame with the expected columns.
+
+    Raises:
+        ValueError: If any column is missing from or unknown to *schema*.
+    """
+    supplied = set(columns)
+    expected = set(schema.columns)
+    if supplied != expected:
+        raise ValueError(
+            f"{name} record columns do not match the schema (missing: {sorted(expected - supplied)}, unexpected: {sorted(supplied - expected)})"
+        )
 
 
 def build_batch_heads_records(
@@ -632,26 +751,26 @@ def build_batch_heads_records(
         process_time: Timestamp when batch processing started.
 
     Returns:
-        A single-row DataFrame matching *schema* ready for ``.extend()``.
+        A single-row DataFrame matching *schema*.
+
+    Raises:
+        ValueError: If the record's columns do not match *schema*.
     """
-    return schema.clone().extend(
-        pl.DataFrame(
-            data={
-                "ID_BATCH": batch_id,
-                "ID_SESSION": session_id,
-                "ID_USER": user_id,
-                "STD_PATH": str(path),
-                "STD_COMPANY": company_key,
-                "STD_ACCOUNT": account_key,
-                "STD_PDF_COUNT": pdf_count,
-                "STD_ERROR_COUNT": errors,
-                "STD_REVIEW_COUNT": reviews,
-                "STD_DURATION_SECS": duration_secs,
-                "STD_UPDATETIME": process_time,
-            },
-            orient="row",
-        )
-    )
+    data = {
+        "ID_BATCH": batch_id,
+        "ID_SESSION": session_id,
+        "ID_USER": user_id,
+        "STD_PATH": str(path),
+        "STD_COMPANY": company_key,
+        "STD_ACCOUNT": account_key,
+        "STD_PDF_COUNT": pdf_count,
+        "STD_ERROR_COUNT": errors,
+        "STD_REVIEW_COUNT": reviews,
+        "STD_DURATION_SECS": duration_secs,
+        "STD_UPDATETIME": process_time,
+    }
+    _require_schema_columns("BatchHeads", data, schema)
+    return pl.DataFrame(data=data, schema=schema.schema, orient="row")
 
 
 def build_batch_lines_records(
@@ -665,9 +784,14 @@ def build_batch_lines_records(
         batch_lines: List of dicts, one per PDF, with batch-line metadata.
 
     Returns:
-        A DataFrame matching *schema* ready for ``.extend()``.
+        A DataFrame matching *schema*.
+
+    Raises:
+        ValueError: If any batch line's keys do not match the columns of *schema*.
     """
-    return schema.clone().extend(pl.DataFrame(batch_lines))
+    for batch_line in batch_lines:
+        _require_schema_columns("BatchLines", batch_line, schema)
+    return pl.DataFrame(batch_lines, schema=schema.schema)
 
 
 def update_parquet(
@@ -690,7 +814,9 @@ def update_parquet(
 
     Iterates through processed PDFs, handles any exceptions, and updates
     the permanent parquet files from temporary files created during processing.
-    Also writes batch header metadata.  Should be called after all PDFs have
+    The temporary files for each table are merged in a single update, so every
+    permanent file is rewritten once per batch.  Also writes batch header
+    metadata.  Should be called after all PDFs have
     been processed to finalise the batch.
 
     Args:
@@ -717,36 +843,55 @@ def update_parquet(
         float: Time spent updating parquet files (seconds).
     """
     update_start = time()
+    # Gather every temp file first so each permanent file is read and rewritten
+    # once per batch rather than once per PDF.
+    batch_lines: list[Path] = []
+    checks_and_balances: list[Path] = []
+    statement_heads: list[Path] = []
+    statement_lines: list[Path] = []
+    worker_error = False
     for pdf in processed_pdfs:
-        # Skip any exceptions that occurred during processing
+        # Stop at the first worker exception; results gathered so far are still merged
         if isinstance(pdf, BaseException):
-            return 0.0
+            worker_error = True
+            break
         elif isinstance(pdf, PdfResult):
             # batch_lines is always present on PdfResult
             if pdf.batch_lines:
-                bl = BatchLines(file=paths.batch_lines, source=pdf.batch_lines)
-                bl.update()
-                bl.cleanup()
-                bl = None
+                batch_lines.append(pdf.batch_lines)
             # checks_and_balances is present for SUCCESS and REVIEW
             if pdf.checks_and_balances:
-                cb = ChecksAndBalances(file=paths.cab, source=pdf.checks_and_balances)
-                cb.update()
-                cb.cleanup()
-                cb = None
+                checks_and_balances.append(pdf.checks_and_balances)
             # statement_heads and statement_lines are only merged for SUCCESS
             if pdf.result == "SUCCESS" and isinstance(pdf.payload, Success):
                 pq_files = pdf.payload.parquet_files
                 if pq_files.statement_heads:
-                    sh = StatementHeads(file=paths.statement_heads, source=pq_files.statement_heads)
-                    sh.update()
-                    sh.cleanup()
-                    sh = None
+                    statement_heads.append(pq_files.statement_heads)
                 if pq_files.statement_lines:
-                    sl = StatementLines(file=paths.statement_lines, source=pq_files.statement_lines)
-                    sl.update()
-                    sl.cleanup()
-                    sl = None
+                    statement_lines.append(pq_files.statement_lines)
+
+    if batch_lines:
+        bl = BatchLines(file=paths.batch_lines, source=batch_lines)
+        bl.update()
+        bl.cleanup()
+        bl = None
+    if checks_and_balances:
+        cb = ChecksAndBalances(file=paths.cab, source=checks_and_balances)
+        cb.update()
+        cb.cleanup()
+        cb = None
+    if statement_heads:
+        sh = StatementHeads(file=paths.statement_heads, source=statement_heads)
+        sh.update()
+        sh.cleanup()
+        sh = None
+    if statement_lines:
+        sl = StatementLines(file=paths.statement_lines, source=statement_lines)
+        sl.update()
+        sl.cleanup()
+        sl = None
+    if worker_error:
+        return 0.0
 
     parquet_secs = time() - update_start
 
@@ -782,7 +927,5 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    pl.Config.set_tbl_rows(500)
-    pl.Config.set_tbl_cols(55)
-    pl.Config.set_fmt_str_lengths(25)
-    main()
+    with pl.Config(tbl_rows=500, tbl_cols=55, fmt_str_lengths=25):
+        main()
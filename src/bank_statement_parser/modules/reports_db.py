@@ -33,6 +33,7 @@ Classes:
 """
 
 import sqlite3
+from contextlib import closing
 from datetime import datetime
 from pathlib import Path
 from typing import Literal
@@ -91,12 +92,23 @@ def _require_db(paths) -> None:
         raise ProjectDatabaseMissing(paths.project_db)
 
 
-def _read_data(db_path: Path, table_name: str) -> pl.LazyFrame:
+def _run_query(db_path: Path, query: str, conn: sqlite3.Connection | None, parameters: list | None = None) -> pl.LazyFrame:
+    """Run *query* through *conn*, or through a short-lived connection to *db_path* when *conn* is ``None``."""
+    execute_options = {"parameters": parameters} if parameters is not None else None
+    if conn is not None:
+        return pl.read_database(query, connection=conn, execute_options=execute_options, infer_schema_length=None).lazy()
+    with closing(sqlite3.connect(db_path)) as own_conn:
+        return pl.read_database(query, connection=own_conn, execute_options=execute_options, infer_schema_length=None).lazy()
+
+
+def _read_data(db_path: Path, table_name: str, conn: sqlite3.Connection | None = None) -> pl.LazyFrame:
     """Read all rows from a SQLite table or view into a LazyFrame.
 
     Args:
         db_path: Path to the SQLite database file.
         table_name: Name of the table or view to read.
+        conn: Optional open connection to read through.  When ``None`` a
+            connection to *db_path* is opened for this read only.
 
     Returns:
         A :class:`pl.LazyFrame` containing all rows from the table/view.
@@ -106,11 +118,16 @@ def _read_data(db_path: Path, table_name: str) -> pl.LazyFrame:
     """
     _validate_read_target(table_name)
     query = f"SELECT * FROM {table_name}"
-    with sqlite3.connect(db_path) as conn:
-        return pl.read_database(query, connection=conn, infer_schema_length=None).lazy()
+    return _run_query(db_path, query, conn)
 
 
-def _read_data_filtered(db_path: Path, table_name: str, batch_table: str, batch_id: str | None) -> pl.LazyFrame:
+def _read_data_filtered(
+    db_path: Path,
+    table_name: str,
+    batch_table: str,
+    batch_id: str | None,
+    conn: sqlite3.Connection | None = None,
+) -> pl.LazyFrame:
     """Read rows from a SQLite table/view, optionally filtered to a single batch.
 
     When *batch_id* is ``None`` the full *table_name* is returned unchanged.
@@ -124,6 +141,8 @@ def _read_data_filtered(db_path: Path, table_name: str, batch_table: str, batch_
         batch_table: Name of the batch-scoped view to query when *batch_id* is
             provided.
         batch_id: Optional batch identifier to filter by.
+        conn: Optional open connection to read through.  When ``None`` a
+            connection to *db_path* is opened for this read only.
 
     Returns:
         A :class:`pl.LazyFrame` containing the matching rows.
@@ -132,11 +151,10 @@ def _read_data_filtered(db_path: Path, table_name: str, batch_table: str, batch_
         ValueError: If *table_name* or *batch_table* is not in the allowed whitelist.
     """
     if batch_id is None:
-        return _read_data(db_path, table_name)
+        return _read_data(db_path, table_name, conn)
     _validate_read_target(batch_table)
     query = f"SELECT * FROM {batch_table} WHERE batch_id = ?"
-    with sqlite3.connect(db_path) as conn:
-        return pl.read_database(query, connection=conn, execute_options={"parameters": [batch_id]}, infer_schema_length=None).lazy()
+    return _run_query(db_path, query, conn, [batch_id])
 
 
 # Excel format strings for date/datetime columns cast from ISO strings.
@@ -218,19 +236,23 @@ def _collect_report_frames(
     Returns:
         A list of ``(name, DataFrame)`` tuples in export order.
     """
-    if type == "multi":
+    paths = ProjectPaths.resolve(project_path)
+    _require_db(paths)
+    # Every report is read through one connection rather than one per report.
+    with closing(sqlite3.connect(paths.project_db)) as conn:
+        if type == "multi":
+            return [
+                ("statement_dimension", DimStatement(project_path, batch_id, conn).all.collect()),
+                ("account_dimension", DimAccount(project_path, batch_id, conn).all.collect()),
+                ("calendar_dimension", DimTime(project_path, batch_id, conn).all.collect()),
+                ("transaction_measures", FactTransaction(project_path, batch_id, conn).all.collect()),
+                ("daily_account_balances", FactBalance(project_path, batch_id, conn).all.collect()),
+                ("missing_statement_report", GapReport(project_path, conn).all.collect()),
+            ]
+        # type == "single"
         return [
-            ("statement_dimension", DimStatement(project_path, batch_id).all.collect()),
-            ("account_dimension", DimAccount(project_path, batch_id).all.collect()),
-            ("calendar_dimension", DimTime(project_path, batch_id).all.collect()),
-            ("transaction_measures", FactTransaction(project_path, batch_id).all.collect()),
-            ("daily_account_balances", FactBalance(project_path, batch_id).all.collect()),
-            ("missing_statement_report", GapReport(project_path).all.collect()),
+            ("transactions", FlatTransaction(project_path, batch_id, conn).all.collect()),
         ]
-    # type == "single"
-    return [
-        ("transactions", FlatTransaction(project_path, batch_id).all.collect()),
-    ]
 
 
 def export_csv(
@@ -489,69 +511,67 @@ def export_reporting_data(project_path: Path | None = None) -> None:
 class FlatTransaction:
     __slots__ = ("all",)
 
-    def __init__(self, project_path: Path | None = None, batch_id: str | None = None) -> None:
+    def __init__(self, project_path: Path | None = None, batch_id: str | None = None, conn: sqlite3.Connection | None = None) -> None:
         paths = ProjectPaths.resolve(project_path)
         _require_db(paths)
-        self.all = _read_data_filtered(paths.project_db, "FlatTransaction", "FlatTransactionBatch", batch_id)
+        self.all = _read_data_filtered(paths.project_db, "FlatTransaction", "FlatTransactionBatch", batch_id, conn)
 
 
 class FactBalance:
     __slots__ = ("all",)
 
-    def __init__(self, project_path: Path | None = None, batch_id: str | None = None) -> None:
+    def __init__(self, project_path: Path | None = None, batch_id: str | None = None, conn: sqlite3.Connection | None = None) -> None:
         paths = ProjectPaths.resolve(project_path)
         _require_db(paths)
-        self.all = _read_data_filtered(paths.project_db, "FactBalance", "FactBalanceBatch", batch_id)
+        self.all = _read_data_filtered(paths.project_db, "FactBalance", "FactBalanceBatch", batch_id, conn)
 
 
 class DimTime:
     __slots__ = ("all",)
 
-    def __init__(self, project_path: Path | None = None, batch_id: str | None = None) -> None:
+    def __init__(self, project_path: Path | None = None, batch_id: str | None = None, conn: sqlite3.Connection | None = None) -> None:
         paths = ProjectPaths.resolve(project_path)
         _require_db(paths)
-        self.all = _read_data_filtered(paths.project_db, "DimDate", "DimDateBatch", batch_id)
+        self.all = _read_data_filtered(paths.project_db, "DimDate", "DimDateBatch", batch_id, conn)
 
 
 class DimStatement:
     __slots__ = ("all",)
 
-    def __init__(self, project_path: Path | None = None, batch_id: str | None = None) -> None:
+    def __init__(self, project_path: Path | None = None, batch_id: str | None = None, conn: sqlite3.Connection | None = None) -> None:
         paths = ProjectPaths.resolve(project_path)
         _require_db(paths)
-        self.all = _read_data_filtered(paths.project_db, "DimStatement", "DimStatementBatch", batch_id)
+        self.all = _read_data_filtered(paths.project_db, "DimStatement", "DimStatementBatch", batch_id, conn)
 
 
 class DimAccount:
     __slots__ = ("all",)
 
-    def __init__(self, project_path: Path | None = None, batch_id: str | None = None) -> None:
+    def __init__(self, project_path: Path | None = None, batch_id: str | None = None, conn: sqlite3.Connection | None = None) -> None:
         paths = ProjectPaths.resolve(project_path)
         _require_db(paths)
-        self.all = _read_data_filtered(paths.project_db, "DimAccount", "DimAccountBatch", batch_id)
+        self.all = _read_data_filtered(paths.project_db, "DimAccount", "DimAccountBatch", batch_id, conn)
 
 
 class FactTransaction:
     __slots__ = ("all",)
 
-    def __init__(self, project_path: Path | None = None, batch_id: str | None = None) -> None:
+    def __init__(self, project_path: Path | None = None, batch_id: str | None = None, conn: sqlite3.Connection | None = None) -> None:
         paths = ProjectPaths.resolve(project_path)
         _require_db(paths)
-        self.all = _read_data_filtered(paths.project_db, "FactTransaction", "FactTransactionBatch", batch_id)
+        self.all = _read_data_filtered(paths.project_db, "FactTransaction", "FactTransactionBatch", batch_id, conn)
 
 
 class GapReport:
     __slots__ = ("all", "gaps")
 
-    def __init__(self, project_path: Path | None = None) -> None:
+    def __init__(self, project_path: Path | None = None, conn: sqlite3.Connection | None = None) -> None:
         paths = ProjectPaths.resolve(project_path)
         _require_db(paths)
-        self.all = _read_data(paths.project_db, "GapReport")
+        self.all = _read_data(paths.project_db, "GapReport", conn)
         self.gaps = self.all.filter(pl.col("gap_flag") == "GAP")
 
 
 if __name__ == "__main__":
-    pl.Config.set_tbl_rows(100)
-    pl.Config.set_tbl_cols(55)
-    pl.Config.set_fmt_str_lengths(25)
-    export_excel(ProjectPaths.resolve().excel.joinpath("test_db.xlsx"), type="single")
+    with pl.Config(tbl_rows=100, tbl_cols=55, fmt_str_lengths=25):
+        export_excel(ProjectPaths.resolve().excel.joinpath("test_db.xlsx"), type="single")
@@ -476,42 +476,30 @@ class Statement:
                 # Perform validation checks on extracted financial data
                 # Compares calculated totals against stated totals from the statement
                 self.checks_and_balances = self.checks_and_balances.with_columns(
+                    # Each check is a plain comparison; eq_missing treats a missing
+                    # value as a failed check rather than propagating null.
                     # Verify payments in (deposits) match between extracted and stated values
-                    BAL_PAYMENTS_IN=pl.when(pl.col("STD_PAYMENTS_IN").sub(pl.col("STD_TRANSACTION_PAYMENTS_IN")) == 0)
-                    .then(pl.lit(True))
-                    .otherwise(pl.lit(False)),
+                    BAL_PAYMENTS_IN=pl.col("STD_PAYMENTS_IN").sub(pl.col("STD_TRANSACTION_PAYMENTS_IN")).eq_missing(0),
                     # Verify payments out (withdrawals) match between extracted and stated values
-                    BAL_PAYMENTS_OUT=pl.when(pl.col("STD_PAYMENTS_OUT").sub(pl.col("STD_TRANSACTION_PAYMENTS_OUT")) == 0)
-                    .then(pl.lit(True))
-                    .otherwise(pl.lit(False)),
+                    BAL_PAYMENTS_OUT=pl.col("STD_PAYMENTS_OUT").sub(pl.col("STD_TRANSACTION_PAYMENTS_OUT")).eq_missing(0),
                     # Verify net movement equals balance change and matches payments difference
-                    BAL_MOVEMENT=pl.when(
-                        (pl.col("STD_MOVEMENT").sub(pl.col("STD_TRANSACTION_MOVEMENT")) == 0)
-                        & (pl.col("STD_TRANSACTION_MOVEMENT").sub(pl.col("STD_BALANCE_OF_PAYMENTS")) == 0)
-                    )
-                    .then(pl.lit(True))
-                    .otherwise(pl.lit(False)),
+                    BAL_MOVEMENT=(
+                        pl.col("STD_MOVEMENT").sub(pl.col("STD_TRANSACTION_MOVEMENT")).eq_missing(0)
+                        & pl.col("STD_TRANSACTION_MOVEMENT").sub(pl.col("STD_BALANCE_OF_PAYMENTS")).eq_missing(0)
+                    ),
                     # Verify closing balance matches running balance or payments calculation
-                    BAL_CLOSING=pl.when(
-                        (pl.col("STD_CLOSING_BALANCE").sub(pl.col("STD_RUNNING_BALANCE")) == 0)
-                        | (
-                            pl.col("STD_PAYMENTS_IN")
-                            .add(pl.col("STD_PAYMENTS_OUT"))
-                            .add(pl.col("STD_TRANSACTION_PAYMENTS_IN").add(pl.col("STD_TRANSACTION_PAYMENTS_OUT")))
-                            == 0
-                        )
-                    )
-                    .then(pl.lit(True))
-                    .otherwise(pl.lit(False)),
-                    # Check if statement has zero transactions (header-only statement)
-                    ZERO_TRANSACTION_STATEMENT=pl.when(
-                        pl.col("STD_PAYMENTS_IN")
+                    BAL_CLOSING=(
+                        pl.col("STD_CLOSING_BALANCE").sub(pl.col("STD_RUNNING_BALANCE")).eq_missing(0)
+                        | pl.col("STD_PAYMENTS_IN")
                         .add(pl.col("STD_PAYMENTS_OUT"))
                         .add(pl.col("STD_TRANSACTION_PAYMENTS_IN").add(pl.col("STD_TRANSACTION_PAYMENTS_OUT")))
-                        == 0
-                    )
-                    .then(pl.lit(True))
-                    .otherwise(pl.lit(False)),
+                        .eq_missing(0)
+                    ),
+                    # Check if statement has zero transactions (header-only statement)
+                    ZERO_TRANSACTION_STATEMENT=pl.col("STD_PAYMENTS_IN")
+                    .add(pl.col("STD_PAYMENTS_OUT"))
+                    .add(pl.col("STD_TRANSACTION_PAYMENTS_IN").add(pl.col("STD_TRANSACTION_PAYMENTS_OUT")))
+                    .eq_missing(0),
                 )
                 # Add transaction-line level validation metrics
                 lines_collected = self.lines_results.collect()
@@ -1148,8 +1136,8 @@ def delete_temp_files(
         pq_files = entry.payload.parquet_files if isinstance(entry.payload, (Success, Review)) else None
         payload_paths = (pq_files.statement_heads, pq_files.statement_lines) if pq_files is not None else ()
         for full_path in (*top_level_paths, *payload_paths):
-            if full_path is not None and full_path.exists():
-                full_path.unlink()
+            if full_path is not None:
+                full_path.unlink(missing_ok=True)
 
 
 def copy_statements_to_project(
@@ -23,6 +23,8 @@ Validates that:
   ``ast.parse``), catching indentation bugs and other parse failures
   regardless of whether optional dependencies are installed.
 - The top-level package is importable at runtime.
+- The process-wide import config cache is reused, and invalidated when the
+  TOML files on disk change.
 """
 
 import ast
@@ -30,6 +32,8 @@ from pathlib import Path
 
 import pytest
 
+from bank_statement_parser.modules.import_config import _CONFIG_CACHE, ImportConfigManager, copy_default_import_config
+
 _PKG_DIR = Path(__file__).resolve().parent.parent / "src" / "bank_statement_parser"
 
 
@@ -51,3 +55,53 @@ class TestSyntax:
 def test_package_importable() -> None:
     """The top-level package must be importable without errors."""
     import bank_statement_parser  # noqa: F401
+
+
+class TestImportConfigCache:
+    """Verify the parsed import config is shared across managers and refreshed on edits."""
+
+    @pytest.fixture
+    def project(self, tmp_path: Path) -> Path:
+        """Return a project root holding a copy of the default import config."""
+        copy_default_import_config(tmp_path / "config" / "import")
+        return tmp_path
+
+    def test_full_load_is_reused(self, project: Path) -> None:
+        """A second manager for the same directory gets the cached config objects."""
+        first = ImportConfigManager(project_path=project)
+        second = ImportConfigManager(project_path=project)
+        assert second.config_dict is first.config_dict
+
+    def test_added_toml_file_is_picked_up(self, project: Path) -> None:
+        """Adding a TOML file invalidates the cached config for that directory."""
+        assert "STD_CACHE_TEST" not in ImportConfigManager(project_path=project).standard_fields
+        assert "STD_CACHE_TEST" not in ImportConfigManager(project_path=project).config_dict["standard_fields"]["config"]
+
+        company_dir = project / "config" / "import" / "CACHE_TEST"
+        company_dir.mkdir()
+        company_dir.joinpath("standard_fields.toml").write_text(
+            '[STD_CACHE_TEST]\nsection = "lines"\ntype = "string"\nvital = false\nstd_refs = []\n'
+        )
+
+        assert "STD_CACHE_TEST" in ImportConfigManager(project_path=project).standard_fields
+        assert "STD_CACHE_TEST" in ImportConfigManager(project_path=project).config_dict["standard_fields"]["config"]
+
+    def test_edited_toml_file_is_picked_up(self, project: Path) -> None:
+        """Editing an existing TOML file invalidates the cached config for that directory."""
+        standard_fields = project / "config" / "import" / "standard_fields.toml"
+        assert ImportConfigManager(project_path=project).standard_fields["STD_STATEMENT_DATE"].vital is True
+
+        standard_fields.write_text(standard_fields.read_text().replace("vital = true", "vital = false", 1))
+
+        assert ImportConfigManager(project_path=project).standard_fields["STD_STATEMENT_DATE"].vital is False
+
+    def test_standard_fields_share_full_load_entry(self, project: Path) -> None:
+        """Once the full config is cached, standard_fields reuses its "all" entry."""
+        config_dir = ImportConfigManager(project_path=project).config_dir
+        full = ImportConfigManager(project_path=project).config_dict
+
+        standard_fields = ImportConfigManager(project_path=project).standard_fields
+
+        assert standard_fields is full["standard_fields"]["config"]
+        assert _CONFIG_CACHE[(config_dir, "all")][1] is full
+        assert (config_dir, "standard_fields") not in _CONFIG_CACHE
@@ -0,0 +1,340 @@
+# This file is part of bank_statement_parser.
+#
+# Copyright (c) 2026 Jason Farrar
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+test_parquet — merging temporary parquet files into the permanent stores.
+
+Uses small synthetic frames written straight to parquet, so no PDF fixtures
+are needed.  Validates that:
+- Several temp files for one table merge in a single update, with the last
+  occurrence of a shared key winning.
+- Permanent files written by older versions (with an ``index`` column) still
+  load and merge.
+- ``update_db`` inserts every row from several temp files per table.
+- Statement-head records are only built from exactly one header row.
+- Batch-line records reject keys that do not match the schema.
+"""
+
+import datetime
+import sqlite3
+from decimal import Decimal
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from bank_statement_parser.modules.data import ParquetFiles, PdfResult, StatementInfo, Success
+from bank_statement_parser.modules.database import update_db
+from bank_statement_parser.modules.parquet import BatchHeads, BatchLines, ChecksAndBalances, StatementHeads, StatementLines
+from bank_statement_parser.modules.paths import ProjectPaths, validate_or_initialise_project
+
+
+def _write_rows(path: Path, schema: pl.DataFrame, rows: list[dict]) -> Path:
+    """Write *rows* to *path* as a parquet file matching *schema*; unspecified columns are null."""
+    pl.DataFrame([{**dict.fromkeys(schema.columns), **row} for row in rows], schema=schema.schema).write_parquet(path)
+    return path
+
+
+def _line(id_transaction: str, id_statement: str, desc: str) -> dict:
+    return {
+        "ID_TRANSACTION": id_transaction,
+        "ID_STATEMENT": id_statement,
+        "STD_TRANSACTION_DATE": datetime.date(2024, 1, 31),
+        "STD_TRANSACTION_DESC": desc,
+        "STD_TRANSACTION_PAYMENTS_IN": Decimal("1.2500"),
+    }
+
+
+def _header(rows: int) -> pl.LazyFrame:
+    """Return extracted header fields repeated *rows* times."""
+    return pl.LazyFrame(
+        {
+            "STD_SORTCODE": ["40-11-22"] * rows,
+            "STD_ACCOUNT_NUMBER": ["12345678"] * rows,
+            "STD_ACCOUNT_HOLDER": ["A N Other"] * rows,
+            "STD_STATEMENT_DATE": [datetime.date(2024, 1, 31)] * rows,
+            "STD_OPENING_BALANCE": [Decimal("10.0000")] * rows,
+            "STD_PAYMENTS_IN": [Decimal("5.0000")] * rows,
+            "STD_PAYMENTS_OUT": [Decimal("2.0000")] * rows,
+            "STD_CLOSING_BALANCE": [Decimal("13.0000")] * rows,
+        },
+        schema_overrides={
+            col: pl.Decimal(16, 4) for col in ("STD_OPENING_BALANCE", "STD_PAYMENTS_IN", "STD_PAYMENTS_OUT", "STD_CLOSING_BALANCE")
+        },
+    )
+
+
+class TestStatementHeadsRecords:
+    """Building the single statement-head record from extracted header fields."""
+
+    def _heads(self, tmp_path: Path, header_results: pl.LazyFrame) -> StatementHeads:
+        return StatementHeads(
+            file=tmp_path / "statement_heads.parquet",
+            id_statement="s1",
+            id_batchline="b1",
+            id_account="acct",
+            company="HSBC",
+            statement_type="Current Account",
+            account="Current Account",
+            header_results=header_results,
+            currency="GBP",
+        )
+
+    def test_single_header_row(self, tmp_path: Path) -> None:
+        """A single header row builds one statement-head record carrying the statement identifiers."""
+        records = self._heads(tmp_path, _header(1)).records
+        assert records is not None
+        assert records.height == 1
+        assert records.row(0, named=True)["ID_STATEMENT"] == "s1"
+        assert records.row(0, named=True)["STD_CLOSING_BALANCE"] == Decimal("13.0000")
+
+    def test_empty_header_raises(self, tmp_path: Path) -> None:
+        """An empty header frame raises ValueError instead of writing a head with no rows."""
+        with pytest.raises(ValueError, match="found 0"):
+            self._heads(tmp_path, _header(0))
+
+    def test_repeated_header_raises(self, tmp_path: Path) -> None:
+        """Several header rows raise ValueError instead of writing heads that share one ID_STATEMENT."""
+        with pytest.raises(ValueError, match="found 2"):
+            self._heads(tmp_path, _header(2))
+
+
+def _batch_line() -> dict:
+    """Return a batch-line dict with every column the schema expects."""
+    return {
+        "ID_BATCH": "batch",
+        "ID_BATCHLINE": "batch_1",
+        "ID_STATEMENT": "s1",
+        "STD_BATCH_LINE": 1,
+        "STD_FILENAME": "statement.pdf",
+        "STD_ACCOUNT": "Current Account",
+        "STD_DURATION_SECS": 0,
+        "STD_UPDATETIME": datetime.datetime(2024, 2, 1),
+        "STD_SUCCESS": True,
+        "STD_ERROR_MESSAGE": "",
+        "ERROR_CAB": False,
+        "ERROR_CONFIG": False,
+        "ERROR_DATA": False,
+    }
+
+
+class TestBatchRecords:
+    """Building batch-head and batch-line records against their schemas."""
+
+    def test_batch_line_matching_schema(self, tmp_path: Path) -> None:
+        """A batch line with exactly the schema's keys builds one record with the schema's dtypes."""
+        wrapper = BatchLines(file=tmp_path / "batch_lines.parquet", batch_lines=[_batch_line()])
+        assert wrapper.records is not None
+        assert wrapper.records.schema == wrapper.schema.schema
+        assert wrapper.records.row(0, named=True)["STD_DURATION_SECS"] == 0.0
+
+    def test_batch_line_unknown_key_raises(self, tmp_path: Path) -> None:
+        """A misspelled batch-line key raises ValueError instead of being written as NULL."""
+        line = _batch_line()
+        line["STD_FILE_NAME"] = line.pop("STD_FILENAME")
+        with pytest.raises(ValueError, match="STD_FILE_NAME"):
+            BatchLines(file=tmp_path / "batch_lines.parquet", batch_lines=[line])
+
+    def test_batch_line_missing_key_raises(self, tmp_path: Path) -> None:
+        """A batch line without one of the schema's keys raises ValueError."""
+        line = _batch_line()
+        del line["ERROR_DATA"]
+        with pytest.raises(ValueError, match="ERROR_DATA"):
+            BatchLines(file=tmp_path / "batch_lines.parquet", batch_lines=[_batch_line(), line])
+
+    def test_batch_heads_matching_schema(self, tmp_path: Path) -> None:
+        """Batch-head metadata builds one record with the schema's dtypes."""
+        wrapper = BatchHeads(
+            file=tmp_path / "batch_heads.parquet",
+            batch_id="batch",
+            session_id="session",
+            user_id="user",
+            path="/pdfs",
+            company_key=None,
+            account_key=None,
+            pdf_count=1,
+            errors=0,
+            reviews=0,
+            duration_secs=1.5,
+            process_time=datetime.datetime(2024, 2, 1),
+        )
+        assert wrapper.records is not None
+        assert wrapper.records.height == 1
+        assert wrapper.records.schema == wrapper.schema.schema
+
+
+class TestParquetUpdate:
+    """Merging temp files into a permanent parquet file."""
+
+    @pytest.fixture
+    def schema(self, tmp_path: Path) -> pl.DataFrame:
+        return StatementLines(file=tmp_path / "unused.parquet").schema
+
+    def test_shared_key_last_file_wins(self, tmp_path: Path, schema: pl.DataFrame) -> None:
+        """The row from the later temp file wins when two temp files share a key."""
+        first = _write_rows(tmp_path / "a.parquet", schema, [_line("s1.1", "s1", "old"), _line("s1.2", "s1", "kept")])
+        second = _write_rows(tmp_path / "b.parquet", schema, [_line("s1.1", "s1", "new")])
+        permanent = tmp_path / "statement_lines.parquet"
+
+        StatementLines(file=permanent, source=[first, second]).update()
+
+        result = pl.read_parquet(permanent).sort("ID_TRANSACTION")
+        assert result["ID_TRANSACTION"].to_list() == ["s1.1", "s1.2"]
+        assert result["STD_TRANSACTION_DESC"].to_list() == ["new", "kept"]
+
+    def test_incoming_rows_replace_existing_rows(self, tmp_path: Path, schema: pl.DataFrame) -> None:
+        """Incoming rows replace permanent rows with the same key and leave the others untouched."""
+        permanent = _write_rows(tmp_path / "statement_lines.parquet", schema, [_line("s1.1", "s1", "old"), _line("s2.1", "s2", "other")])
+        temp = _write_rows(tmp_path / "temp.parquet", schema, [_line("s1.1", "s1", "new")])
+
+        StatementLines(file=permanent, source=temp).update()
+
+        result = pl.read_parquet(permanent).sort("ID_TRANSACTION")
+        assert result["STD_TRANSACTION_DESC"].to_list() == ["new", "other"]
+
+    def test_legacy_index_column_still_loads(self, tmp_path: Path, schema: pl.DataFrame) -> None:
+        """Files carrying the legacy ``index`` column load without it and merge normally."""
+        permanent = tmp_path / "statement_lines.parquet"
+        legacy = pl.DataFrame([{**dict.fromkeys(schema.columns), **_line("s1.1", "s1", "old")}], schema=schema.schema)
+        legacy.with_row_index().write_parquet(permanent)
+        temp = tmp_path / "temp.parquet"
+        legacy.with_columns(ID_TRANSACTION=pl.lit("s1.2")).with_row_index().write_parquet(temp)
+
+        wrapper = StatementLines(file=permanent, source=temp)
+        assert wrapper._load_existing().collect_schema().names() == schema.columns
+        wrapper.update()
+
+        result = pl.read_parquet(permanent)
+        assert result.columns == schema.columns
+        assert sorted(result["ID_TRANSACTION"].to_list()) == ["s1.1", "s1.2"]
+
+    def test_reading_db_records_leaves_stale_file(self, tmp_path: Path, schema: pl.DataFrame) -> None:
+        """Reading db_records never deletes a file whose layout no longer matches the schema."""
+        stale = tmp_path / "statement_lines.parquet"
+        pl.DataFrame({"ID_BATCH": ["old"]}).write_parquet(stale)
+
+        wrapper = StatementLines(file=stale)
+
+        assert wrapper.db_records.collect_schema().names() == schema.columns
+        assert stale.exists()
+
+    def test_update_replaces_stale_file(self, tmp_path: Path, schema: pl.DataFrame) -> None:
+        """An update discards a file with a stale layout and writes only the incoming rows."""
+        stale = tmp_path / "statement_lines.parquet"
+        pl.DataFrame({"ID_BATCH": ["old"]}).write_parquet(stale)
+        temp = _write_rows(tmp_path / "temp.parquet", schema, [_line("s1.1", "s1", "new")])
+
+        StatementLines(file=stale, source=temp).update()
+
+        result = pl.read_parquet(stale)
+        assert result.columns == schema.columns
+        assert result["ID_TRANSACTION"].to_list() == ["s1.1"]
+
+
+class TestUpdateDb:
+    """Inserting a batch's temp files into the project database."""
+
+    @pytest.fixture
+    def project(self, tmp_path: Path) -> Path:
+        validate_or_initialise_project(tmp_path)
+        return tmp_path
+
+    def test_inserts_every_row_from_every_temp_file(self, project: Path, tmp_path: Path) -> None:
+        """update_db inserts every row from several temp files per table and removes the temp files."""
+        temp = tmp_path / "temp"
+        temp.mkdir()
+        batch_lines_schema = BatchLines(file=temp / "unused.parquet").schema
+        cab_schema = ChecksAndBalances(file=temp / "unused.parquet").schema
+        heads_schema = StatementHeads(file=temp / "unused.parquet").schema
+        lines_schema = StatementLines(file=temp / "unused.parquet").schema
+
+        processed: list[BaseException | PdfResult] = []
+        for n in range(3):
+            id_statement = f"s{n}"
+            id_batchline = f"b{n}"
+            info = StatementInfo(
+                id_statement=id_statement,
+                id_account="acct",
+                account="Current Account",
+                statement_date=datetime.date(2024, 1, 31),
+                payments_in=Decimal(0),
+                payments_out=Decimal(0),
+                opening_balance=Decimal(0),
+                closing_balance=Decimal(0),
+                filename_new=f"acct_{n}.pdf",
+            )
+            files = ParquetFiles(
+                statement_heads=_write_rows(
+                    temp / f"heads_{n}.parquet",
+                    heads_schema,
+                    [
+                        {
+                            "ID_STATEMENT": id_statement,
+                            "ID_BATCHLINE": id_batchline,
+                            "ID_ACCOUNT": "acct",
+                            "STD_STATEMENT_DATE": datetime.date(2024, 1, 31),
+                        }
+                    ],
+                ),
+                statement_lines=_write_rows(
+                    temp / f"lines_{n}.parquet",
+                    lines_schema,
+                    [_line(f"{id_statement}.{i}", id_statement, "desc") for i in range(n + 1)],
+                ),
+            )
+            processed.append(
+                PdfResult(
+                    result="SUCCESS",
+                    outcome="SUCCESS",
+                    batch_lines=_write_rows(
+                        temp / f"batch_lines_{n}.parquet",
+                        batch_lines_schema,
+                        [{"ID_BATCH": "batch", "ID_BATCHLINE": id_batchline, "ID_STATEMENT": id_statement, "STD_SUCCESS": True}],
+                    ),
+                    checks_and_balances=_write_rows(
+                        temp / f"cab_{n}.parquet", cab_schema, [{"ID_CAB": f"c{n}", "ID_BATCHLINE": id_batchline, "ID_BATCH": "batch"}]
+                    ),
+                    payload=Success(statement_info=info, parquet_files=files),
+                )
+            )
+
+        update_db(
+            processed_pdfs=processed,
+            batch_id="batch",
+            session_id="session",
+            user_id="user",
+            path=str(temp),
+            company_key=None,
+            account_key=None,
+            pdf_count=0,  # skip the datamart rebuild
+            errors=0,
+            reviews=0,
+            duration_secs=0.0,
+            process_time=datetime.datetime(2024, 2, 1),
+            project_path=project,
+        )
+
+        conn = sqlite3.connect(ProjectPaths.resolve(project).project_db)
+        try:
+            counts = {
+                table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("batch_lines", "checks_and_balances", "statement_heads", "statement_lines", "batch_heads")
+            }
+        finally:
+            conn.close()
+        assert counts == {"batch_lines": 3, "checks_and_balances": 3, "statement_heads": 3, "statement_lines": 6, "batch_heads": 1}
+        assert not list(temp.glob("*_*.parquet"))